@@ -24,6 +24,7 @@ setup(
 	package_data={'': ['README.rst', 'HISTORY.rst', 'LICENSE']},
 	include_package_data=True,
 	install_requires=[],
+	extras_require={'numpy': ['numpy']},
 	zip_safe=False,
 	classifiers=(
 		'Development Status :: 5 - Production/Stable',
@@ -2,12 +2,24 @@
 
 from __future__ import division, absolute_import, print_function, unicode_literals
 
+import copy
+import json
+import pickle
 import sys
+import threading
 from decimal import Decimal
+from fractions import Fraction
 
+from nose.plugins.skip import SkipTest
 from nose.tools import assert_equal, assert_raises
 
-from timecodes import Timecode
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+import timecodes
+from timecodes import Accumulator, Timecode, TimecodeMap
 
 
 if sys.version_info[0] >= 3:
@@ -362,3 +374,452 @@ class TestTimecodes(object):
 		
 		for entry in exceptions:
 			assert_raises(entry['exception'], setattr, t, entry['attr'], entry['value'])
+
+
+class TestSerialization(object):
+	def __init__(self):
+		self.timecodes = [entry['obj'] for entry in TestTimecodes().timecodes] + [Timecode(n, 29.97) for n in range(1790, 1810)] + [Timecode(5, 15), Timecode(5, 24.0), Timecode(5, Decimal('29.970')), Timecode(5, 12.5)]
+	
+	def test_pickle(self):
+		for t in self.timecodes:
+			for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+				unpickled = pickle.loads(pickle.dumps(t, protocol))
+				
+				assert_equal(unpickled.__dict__, t.__dict__)
+				assert_equal(repr(unpickled), repr(t))
+				assert_equal(type(unpickled.frame_rate), type(t.frame_rate))
+		
+		assert_equal(Timecode.__reduce__(Timecode('01:01:00;02', 29.97))[1], (109692, 3, True))
+		assert_equal(Timecode.__reduce__(Timecode(5, 15))[1], (5, '15', False))
+	
+	def test_frame_rate_type(self):
+		for frame_rate in (24, 24.0, Decimal('24'), Decimal('24.00')):
+			assert_equal(repr(Timecode(0, frame_rate).frame_rate), "Decimal('24')")
+		
+		assert_equal(repr(Timecode(0, Decimal('29.970')).frame_rate), "Decimal('29.97')")
+	
+	def test_encode_timecodes(self):
+		values = [Timecode(n, 29.97) for n in range(1790, 1810)]
+		data = timecodes.encode_timecodes(values)
+		
+		assert_equal(data, {'frame_rate': 3, 'is_drop_frame': True, 'frames': list(range(1790, 1810))})
+		assert_equal([t.__dict__ for t in timecodes.decode_timecodes(json.loads(json.dumps(data)))], [t.__dict__ for t in values])
+		assert_equal(timecodes.decode_timecodes(timecodes.encode_timecodes([])), [])
+		assert_raises(ValueError, timecodes.encode_timecodes, [Timecode(0, 25), Timecode(0, 30)])
+
+
+class TestThreadSafety(object):
+	def __init__(self):
+		self.thread_count = 16
+		self.iterations = 500
+	
+	def run_threads(self, target):
+		switch_interval = sys.getswitchinterval() if hasattr(sys, 'getswitchinterval') else None
+		
+		if switch_interval is not None:
+			sys.setswitchinterval(1e-6)
+		
+		try:
+			threads = [threading.Thread(target=target) for _ in range(self.thread_count)]
+			
+			for thread in threads:
+				thread.start()
+			
+			for thread in threads:
+				thread.join()
+		
+		finally:
+			if switch_interval is not None:
+				sys.setswitchinterval(switch_interval)
+	
+	def test_shared_timecode(self):
+		t = Timecode('01:00:00;00', 29.97)
+		valid_states = set()
+		
+		for frames in (107892, 215784):
+			for frame_rate in (29.97, 59.94):
+				valid = Timecode(frames, frame_rate)
+				valid_states.add((valid.timecode, valid.total_frames, valid.frame_rate, valid.is_drop_frame))
+		
+		seen_states = []
+		
+		def worker():
+			for i in range(self.iterations):
+				if i % 3 == 0:
+					t.total_frames = 107892 if i % 2 else 215784
+				
+				elif i % 3 == 1:
+					t.convert_to(frame_rate=59.94 if i % 2 else 29.97, preserving='frames')
+				
+				snapshot = copy.copy(t)
+				seen_states.append((snapshot.timecode, snapshot.total_frames, snapshot.frame_rate, snapshot.is_drop_frame))
+				
+				result = (t + 1) - 1
+				seen_states.append((result.timecode, result.total_frames, result.frame_rate, result.is_drop_frame))
+		
+		self.run_threads(worker)
+		
+		for state in seen_states:
+			if state not in valid_states:
+				assert_equal(state, None)
+		
+		assert_equal(len(seen_states), 2 * self.thread_count * self.iterations)
+	
+	def test_independent_conversions(self):
+		results = {}
+		
+		def worker():
+			converted = []
+			
+			for frames in range(0, 2000000, 20000):
+				t = Timecode(frames, 29.97)
+				t.convert_to(frame_rate=23.976, preserving='timecode')
+				converted.append(t.total_frames)
+			
+			results[threading.current_thread().name] = converted
+		
+		self.run_threads(worker)
+		
+		expected = []
+		
+		for frames in range(0, 2000000, 20000):
+			t = Timecode(frames, 29.97)
+			t.convert_to(frame_rate=23.976, preserving='timecode')
+			expected.append(t.total_frames)
+		
+		for converted in results.values():
+			assert_equal(converted, expected)
+		
+		assert_equal(len(results), self.thread_count)
+
+
+class TestConversion(object):
+	def test_converted(self):
+		t = Timecode('01:00:00;00', 29.97)
+		
+		assert_equal(t.converted(frame_rate=25, preserving='seconds').timecode, '01:00:00:00')
+		assert_equal(t.converted(frame_rate=59.94, preserving='timecode').total_frames, 215784)
+		assert_equal(t.converted(frame_rate=59.94, preserving='frames').timecode, '00:30:00;00')
+		assert_equal(t.converted(is_drop_frame=False, preserving='frames').timecode, '00:59:56:12')
+		assert_equal((t.timecode, t.frame_rate, t.is_drop_frame), ('01:00:00;00', Decimal('29.97'), True))
+		assert_raises(ValueError, t.converted, frame_rate=25)
+	
+	def test_drop_frame(self):
+		t = Timecode('01:00:00:00', 29.97, is_drop_frame=False)
+		
+		assert_equal((t.is_drop_frame, t.total_frames), (False, 108000))
+		
+		t.frame_rate = 59.94
+		assert_equal((t.is_drop_frame, t.timecode), (False, '00:30:00:00'))
+		
+		t.convert_to(frame_rate=30, preserving='frames')
+		t.convert_to(frame_rate=29.97, preserving='frames')
+		assert_equal((t.is_drop_frame, t.timecode), (True, '01:00:03;18'))
+		
+		assert_equal(Timecode('00:01:01;00', 29.97).total_frames, 1828)
+		assert_equal(Timecode('00:01:00;00', 29.97).total_frames, 1800)
+
+
+class TestAggregation(object):
+	def __init__(self):
+		self.timecodes = [Timecode('00:10:00;00', 29.97), Timecode('01:00:00;00', 29.97), Timecode('00:00:30;00', 29.97)]
+	
+	def test_helpers(self):
+		assert_equal(timecodes.total(self.timecodes), Timecode(17982 + 107892 + 900, 29.97))
+		assert_equal(timecodes.minimum(self.timecodes).timecode, '00:00:30;00')
+		assert_equal(timecodes.maximum(self.timecodes).timecode, '01:00:00;00')
+		assert_equal(timecodes.span(self.timecodes).total_frames, 107892 - 900)
+		assert_equal(timecodes.total(self.timecodes).is_drop_frame, True)
+	
+	def test_mixed_values(self):
+		values = [Timecode('00:00:01:00', 60), 1.0, '00:00:01:00', 30]
+		
+		assert_equal(timecodes.total(values, 30).total_frames, 120)
+		assert_equal(timecodes.minimum(values, 30).total_frames, 30)
+		assert_equal(timecodes.total([], 23.98).timecode, '00:00:00:00')
+	
+	def test_accumulator(self):
+		accumulator = Accumulator()
+		
+		for t in self.timecodes:
+			accumulator.add(t)
+		
+		accumulator.add(10)
+		
+		assert_equal(accumulator.count, 4)
+		assert_equal(accumulator.total_frames, 17982 + 107892 + 900 + 10)
+		assert_equal(accumulator.frame_rate, Decimal('29.97'))
+		assert_equal(accumulator.minimum.total_frames, 10)
+		assert_equal(accumulator.span.total_frames, 107892 - 10)
+		
+		assert_equal(timecodes.total([Timecode(0, 29.97)], is_drop_frame=False).is_drop_frame, False)
+		assert_equal(timecodes.total([Timecode(0, 29.97, is_drop_frame=False)]).is_drop_frame, False)
+		assert_equal(timecodes.total([Timecode(0, 25)], is_drop_frame=True).is_drop_frame, False)
+	
+	def test_exceptions(self):
+		assert_raises(ValueError, timecodes.total, [])
+		assert_raises(ValueError, timecodes.total, [1])
+		assert_raises(ValueError, timecodes.minimum, [], 30)
+		assert_raises(ValueError, timecodes.span, [], 30)
+		assert_raises(TypeError, timecodes.total, [None], 30)
+
+
+class TestAudio(object):
+	def test_samples_per_frame(self):
+		assert_equal(timecodes.samples_per_frame(29.97, 48000), Fraction(8008, 5))
+		assert_equal(timecodes.samples_per_frame(25, 96000), 3840)
+		assert_equal(timecodes.samples_per_frame(29.97, 44100), Fraction(147147, 100))
+		assert_equal(timecodes.samples_per_frame(23.976, 48000 * timecodes.PULL_DOWN), 2000)
+		assert_equal(timecodes.samples_per_frame(24, 48000 * timecodes.PULL_UP), Fraction(2002))
+	
+	def test_cadence(self):
+		starts = [timecodes.timecode_to_sample(Timecode(n, 29.97), 48000) for n in range(6)]
+		
+		assert_equal([b - a for a, b in zip(starts, starts[1:])], [1602, 1601, 1602, 1601, 1602])
+	
+	def test_timecodes(self):
+		t = Timecode('01:00:00;00', 29.97)
+		sample = timecodes.timecode_to_sample(t, 48000)
+		
+		assert_equal(sample, 172799827)
+		assert_equal(timecodes.sample_to_timecode(sample, 29.97, 48000), t)
+		assert_equal(timecodes.sample_to_timecode(sample - 1, 29.97, 48000).timecode, '00:59:59;29')
+		assert_equal(timecodes.sample_to_timecode(48000, 25, 48000).timecode, '00:00:01:00')
+
+
+class TestFilm(object):
+	def test_footage(self):
+		assert_equal(timecodes.frames_to_footage(1440), '90+00')
+		assert_equal(timecodes.frames_to_footage(Timecode('00:01:00:00', 23.976)), '90+00')
+		assert_equal(timecodes.frames_to_footage(-17), '-2+15')
+		assert_equal(timecodes.frames_to_footage(-1, '35mm 3-perf'), '-1+20')
+		assert_equal(timecodes.frames_to_footage(41, '16mm'), '1+01')
+		assert_equal([timecodes.frames_to_footage(n, '35mm 3-perf') for n in (21, 22, 42, 43, 63, 64)], ['0+21', '1+00', '1+20', '2+00', '2+20', '3+00'])
+		
+		for film_format in timecodes.FILM_FORMATS:
+			for frames in range(-200, 2000, 7):
+				assert_equal(timecodes.footage_to_frames(timecodes.frames_to_footage(frames, film_format), film_format), frames)
+	
+	def test_keycode(self):
+		assert_equal(timecodes.frames_to_keycode(27, 'KU 22 9612 1234+05'), 'KU 22 9612 1236+00')
+		assert_equal(timecodes.frames_to_keycode(Timecode(1, 23.976), '0099+15'), '0100+00')
+		assert_equal(timecodes.keycode_to_frames('KU 22 9612 1236+00', 'KU 22 9612 1234+05'), 27)
+		assert_equal(timecodes.frames_to_keycode(25, 'KJ 23 1234 5678+00', '16mm'), 'KJ 23 1234 5679+05')
+		assert_equal(timecodes.keycode_to_frames('KJ 23 1234 5679+05', 'KJ 23 1234 5678+00', '16mm'), 25)
+		assert_equal(timecodes.frames_to_keycode(-21, '0001+05'), '0000+00')
+	
+	def test_exceptions(self):
+		assert_raises(ValueError, timecodes.footage_to_frames, '1+21', '35mm 3-perf')
+		assert_raises(ValueError, timecodes.footage_to_frames, '0+16')
+		assert_raises(ValueError, timecodes.footage_to_frames, 'KU 1+00')
+		assert_raises(ValueError, timecodes.footage_to_frames, '1:00')
+		assert_raises(ValueError, timecodes.frames_to_footage, 0, '70mm')
+		assert_raises(ValueError, timecodes.keycode_to_frames, 'KU 1+00', 'KJ 1+00')
+		assert_raises(ValueError, timecodes.frames_to_keycode, -30, '0001+05')
+		assert_raises(ValueError, timecodes.frames_to_keycode, 0, '1+20', '16mm')
+		assert_raises(ValueError, timecodes.keycode_to_frames, '-1+00', '0+00')
+		assert_raises(TypeError, timecodes.frames_to_footage, 1.0)
+
+
+class TestTimecodeMap(object):
+	def __init__(self):
+		self.timecodes = list(range(100, 200)) + list(range(500, 550)) + list(range(300, 320))
+		self.map = TimecodeMap.from_timecodes(Timecode(frames, 29.97) for frames in self.timecodes)
+	
+	def test_from_timecodes(self):
+		assert_equal(self.map.segments, [(0, 100), (100, 500), (150, 300)])
+		assert_equal(len(self.map), 170)
+		assert_equal(self.map.frame_rate, Decimal('29.97'))
+		assert_equal(TimecodeMap.from_timecodes(['00:00:01:00', '00:00:01:01', '00:00:05:00'], 25).segments, [(0, 25), (2, 125)])
+	
+	def test_lookups(self):
+		for file_frame, frames in enumerate(self.timecodes):
+			assert_equal(self.map.timecode_at(file_frame).total_frames, frames)
+			assert_equal(self.map.file_frame_at(frames), file_frame)
+		
+		assert_equal(self.map.file_frame_at('00:00:10;10'), 160)
+		assert_equal(self.map.file_frame_at(Timecode(500, 29.97)), 100)
+	
+	def test_overlapping_segments(self):
+		timecode_map = TimecodeMap([(0, 100), (100, 150)], 110, 25)
+		
+		assert_equal(timecode_map.file_frame_at(180), 80)
+		assert_equal(timecode_map.file_frame_at(155), 55)
+		assert_raises(ValueError, timecode_map.file_frame_at, 200)
+		
+		timecode_map = TimecodeMap([(0, 500), (10, 100), (20, 95), (30, 504)], 40, 25)
+		values = [timecode_map.timecode_at(file_frame).total_frames for file_frame in range(40)]
+		
+		for frames in range(90, 520):
+			if frames in values:
+				assert_equal(timecode_map.file_frame_at(frames), values.index(frames))
+			
+			else:
+				assert_raises(ValueError, timecode_map.file_frame_at, frames)
+	
+	def test_exceptions(self):
+		assert_raises(IndexError, self.map.timecode_at, -1)
+		assert_raises(IndexError, self.map.timecode_at, 170)
+		assert_raises(ValueError, self.map.file_frame_at, 250)
+		assert_raises(ValueError, self.map.file_frame_at, 99)
+		assert_raises(ValueError, TimecodeMap, [(0, 1), (0, 5)], 10, 25)
+		assert_raises(ValueError, TimecodeMap, [(0, 1), (5, 5)], 5, 25)
+		assert_raises(ValueError, TimecodeMap, [], 10, 25)
+		assert_raises(ValueError, TimecodeMap, [(-1, 0), (5, 5)], 10, 25)
+		assert_raises(ValueError, TimecodeMap.from_timecodes, [])
+
+
+class TestNumpy(object):
+	def __init__(self):
+		if numpy is None:
+			raise SkipTest('numpy is not installed')
+	
+	def test_frame_duration(self):
+		assert_equal(timecodes.frame_duration(29.97), Fraction(1001, 30000))
+		assert_equal(timecodes.frame_duration(23.98), Fraction(1001, 24000))
+		assert_equal(timecodes.frame_duration(59.94), Fraction(1001, 60000))
+		assert_equal(timecodes.frame_duration(25), Fraction(1, 25))
+	
+	def test_timedelta64(self):
+		frames = numpy.arange(-10, 5000000, 13)
+		
+		for frame_rate in (23.976, 24, 25, 29.97, 30, 59.94, 60):
+			deltas = timecodes.frames_to_timedelta64(frames, frame_rate)
+			
+			assert_equal(deltas.dtype, numpy.dtype('timedelta64[ns]'))
+			assert_equal(timecodes.timedelta64_to_frames(deltas, frame_rate).tolist(), frames.tolist())
+		
+		assert_raises(OverflowError, timecodes.frames_to_timedelta64, [2 ** 41], 25)
+		assert_raises(OverflowError, timecodes.frames_to_timedelta64, [-2 ** 41], 25)
+		
+		for frame_rate in (23.976, 25, 29.97, 60):
+			numerator, denominator = timecodes._nanoseconds_per_frame(frame_rate)
+			longest = ((denominator * (2 ** 64 - 1)) - 1) // (2 * numerator)
+			deltas = timecodes.frames_to_timedelta64([-longest, longest], frame_rate)
+			
+			assert_equal(numpy.isnat(deltas).tolist(), [False, False])
+			assert deltas[1] > numpy.timedelta64(0, 'ns') > deltas[0]
+			assert_raises(OverflowError, timecodes.frames_to_timedelta64, [longest + 1], frame_rate)
+		
+		assert_equal(timecodes.frames_to_timedelta64([1, 107892], 29.97).astype(numpy.int64).tolist(), [33366667, 3599996400000])
+		assert_equal(timecodes.timedelta64_to_frames(numpy.array([16683333, 16683334], dtype='timedelta64[ns]'), 29.97).tolist(), [0, 1])
+	
+	def test_datetime64(self):
+		start = numpy.datetime64('2013-01-12T10:00:00')
+		datetimes = timecodes.frames_to_datetime64([0, 25, 90000], 25, start)
+		
+		assert_equal(datetimes.tolist()[1], numpy.datetime64('2013-01-12T10:00:01', 'ns').tolist())
+		assert_equal(timecodes.datetime64_to_frames(datetimes, 25, start).tolist(), [0, 25, 90000])
+	
+	def test_nat(self):
+		deltas = numpy.array([1000000000, 'NaT'], dtype='timedelta64[ns]')
+		frames = timecodes.timedelta64_to_frames(deltas, 25)
+		
+		assert_equal(frames.tolist(), [25, timecodes.NAT_FRAMES])
+		assert_equal(numpy.isnat(timecodes.frames_to_timedelta64(frames, 25)).tolist(), [False, True])
+		
+		start = numpy.datetime64('2013-01-12T10:00:00')
+		datetimes = numpy.array(['2013-01-12T10:00:01', 'NaT'], dtype='datetime64[ns]')
+		frames = timecodes.datetime64_to_frames(datetimes, 25, start)
+		
+		assert_equal(frames.tolist(), [25, timecodes.NAT_FRAMES])
+		assert_equal(numpy.isnat(timecodes.frames_to_datetime64(frames, 25, start)).tolist(), [False, True])
+		assert_equal(timecodes.timedelta64_to_frames(numpy.timedelta64('NaT'), 25), timecodes.NAT_FRAMES)
+	
+	def test_timecodes(self):
+		frames = timecodes.frames_array([Timecode('01:00:00;00', 29.97), Timecode('00:00:01;00', 29.97)])
+		
+		assert_equal(frames.tolist(), [107892, 30])
+		assert_equal([t.timecode for t in timecodes.timecodes_from_frames(frames, 29.97)], ['01:00:00;00', '00:00:01;00'])
+		assert_equal([t.__dict__ for t in timecodes.timecodes_from_frames(numpy.arange(1790, 1810), 29.97)], [Timecode(n, 29.97).__dict__ for n in range(1790, 1810)])
+		assert_raises(ValueError, timecodes.timecodes_from_frames, numpy.array([0, timecodes.NAT_FRAMES]), 25)
+
+	def test_samples(self):
+		frames = numpy.arange(-10, 500000, 7)
+		
+		for frame_rate in (23.976, 24, 25, 29.97, 30, 59.94):
+			for sample_rate in (44100, 48000, 96000, 48000 * timecodes.PULL_UP, 48000 * timecodes.PULL_DOWN):
+				samples = timecodes.frames_to_samples(frames, frame_rate, sample_rate)
+				
+				assert_equal(timecodes.samples_to_frames(samples, frame_rate, sample_rate).tolist(), frames.tolist())
+				assert_equal(timecodes.samples_to_frames(samples - 1, frame_rate, sample_rate).tolist(), (frames - 1).tolist())
+		
+		assert_equal(numpy.diff(timecodes.frames_to_samples(numpy.arange(6), 29.97, 48000)).tolist(), [1602, 1601, 1602, 1601, 1602])
+	
+	def test_feet(self):
+		frames = numpy.arange(-100, 100000)
+		
+		for film_format in timecodes.FILM_FORMATS:
+			feet, feet_frames = timecodes.frames_to_feet(frames, film_format)
+			
+			assert_equal(timecodes.feet_to_frames(feet, feet_frames, film_format).tolist(), frames.tolist())
+			
+			for frame, foot, foot_frames in list(zip(frames.tolist(), feet.tolist(), feet_frames.tolist()))[::97]:
+				assert_equal(timecodes.frames_to_footage(frame, film_format), '%d+%02d' % (foot, foot_frames))
+				assert_equal(timecodes.footage_to_frames('%d+%02d' % (foot, foot_frames), film_format), frame)
+		
+		feet, feet_frames = timecodes.frames_to_feet([21, 22, 43], '35mm 3-perf')
+		
+		assert_equal((feet.tolist(), feet_frames.tolist()), ([0, 1, 2], [21, 0, 0]))
+		assert_raises(ValueError, timecodes.feet_to_frames, [1], [16])
+		assert_raises(ValueError, timecodes.feet_to_frames, [0, 1], [21, 21], '35mm 3-perf')
+		assert_raises(ValueError, timecodes.feet_to_frames, [0], [-1])
+		assert_equal(timecodes.feet_to_frames([0, 1], 20, '35mm 3-perf').tolist(), [20, 42])
+	
+	def test_keys(self):
+		frames = numpy.arange(-100, 10000)
+		
+		for film_format in timecodes.FILM_FORMATS:
+			keys, key_frames = timecodes.frames_to_keys(frames, 'KU 22 9612 0010+00', film_format)
+			
+			assert_equal(timecodes.keys_to_frames(keys, key_frames, 'KU 22 9612 0010+00', film_format).tolist(), frames.tolist())
+			
+			for frame, key, key_frame in list(zip(frames.tolist(), keys.tolist(), key_frames.tolist()))[::97]:
+				assert_equal(timecodes.frames_to_keycode(frame, 'KU 22 9612 0010+00', film_format), 'KU 22 9612 %04d+%02d' % (key, key_frame))
+		
+		assert_raises(ValueError, timecodes.frames_to_keys, [0, -30], '0001+05')
+		assert_raises(ValueError, timecodes.keys_to_frames, [-1], [0], '0000+00')
+		assert_raises(ValueError, timecodes.keys_to_frames, [1], [20], '0000+00', '16mm')
+	
+	def test_timecode_map(self):
+		frames = numpy.array(list(range(100, 200)) + list(range(500, 550)) + list(range(300, 320)))
+		timecode_map = TimecodeMap.from_timecodes(frames, 29.97)
+		
+		assert_equal(timecode_map.segments, [(0, 100), (100, 500), (150, 300)])
+		assert_equal(timecode_map.timecode_frames(numpy.arange(170)).tolist(), frames.tolist())
+		assert_equal(timecode_map.timecode_frames([-1, 170]).tolist(), [-1, -1])
+		assert_equal(timecode_map.file_frames(frames).tolist(), list(range(170)))
+		assert_equal(timecode_map.file_frames([0, 99, 200, 320, 550]).tolist(), [-1] * 5)
+		assert_equal(TimecodeMap([], 0, 25).file_frames([0]).tolist(), [-1])
+		assert_equal(TimecodeMap([(0, 100), (100, 150)], 110, 25).file_frames([180, 155, 99, 200]).tolist(), [80, 55, -1, -1])
+	
+	def test_validate_timecodes(self):
+		values = ['01:00:00;00', '99:59:59:99 trailing junk', '00:01:00;00', '00:01:00;02', '00:00:00;30', None, ' 10:10:10;10\n', '01:23:45;12']
+		frames, invalid, reasons = timecodes.validate_timecodes(values, 29.97)
+		
+		assert_equal(frames.tolist(), [107892, 0, 0, 1800, 0, 0, 1097212, 150612])
+		assert_equal(invalid.tolist(), [False, True, True, False, True, True, False, False])
+		assert_equal(reasons.tolist(), [timecodes.VALID, timecodes.BAD_FORMAT, timecodes.DROPPED_FRAME, timecodes.VALID, timecodes.BAD_FRAMES, timecodes.BAD_FORMAT, timecodes.VALID, timecodes.VALID])
+		
+		for value, total_frames, is_invalid in zip(values, frames, invalid):
+			if not is_invalid:
+				assert_equal(Timecode(value, 29.97).total_frames, total_frames)
+		
+		frames, invalid, reasons = timecodes.validate_timecodes(['00:01:00:00', '00:01:00;03', '00:00:00:60'], 59.94)
+		
+		assert_equal(reasons.tolist(), [timecodes.DROPPED_FRAME, timecodes.DROPPED_FRAME, timecodes.BAD_FRAMES])
+		assert_equal(timecodes.validate_timecodes(['00:01:00:00'], 25)[0].tolist(), [1500])
+		assert_equal(len(timecodes.validate_timecodes([], 25)[0]), 0)
+	
+	def test_validate_timecodes_parity(self):
+		for frame_rate, rate in ((29.97, 30), (59.94, 60)):
+			values = ['00:%02d:%02d;%02d' % (minutes, seconds, frames) for minutes in (0, 1, 2) for seconds in range(60) for frames in range(rate)]
+			frames, invalid, reasons = timecodes.validate_timecodes(values, frame_rate)
+			
+			assert_equal(set(reasons.tolist()), set([timecodes.VALID, timecodes.DROPPED_FRAME]))
+			assert_equal(frames[~invalid].tolist(), list(range(len(values) - ((rate // 15) * 2))))
+			
+			for value, total_frames, is_invalid in zip(values, frames.tolist(), invalid.tolist()):
+				if not is_invalid:
+					assert_equal(Timecode(value, frame_rate).total_frames, total_frames)
+					assert_equal(Timecode(total_frames, frame_rate).timecode, value)
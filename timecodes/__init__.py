@@ -5,9 +5,17 @@ from __future__ import division, absolute_import, print_function, unicode_litera
 import operator
 import re
 import sys
+from bisect import bisect_right
+from heapq import heappop, heappush
 from decimal import Decimal
+from fractions import Fraction
 from math import floor
 
+try:
+	import numpy
+except ImportError: # pragma: no cover (optional dependency).
+	numpy = None
+
 
 VERSION = (0, 0, 1)
 
@@ -25,6 +33,33 @@ if sys.version_info[0] >= 3: # pragma: no cover (version compatibility, unreacha
 	basestring = str
 
 
+_TIMECODE_PATTERN = re.compile(r'^.*?([0-9]{2,})[:;]?([0-5][0-9])[:;]?([0-5][0-9])[:;]?([0-9]{1,}).*?$')
+
+_STRICT_TIMECODE_PATTERN = re.compile(r'^\s*([0-9]{2,4})[:;]([0-5][0-9])[:;]([0-5][0-9])[:;.,]([0-9]{2,3})\s*$')
+
+_FOOTAGE_PATTERN = re.compile(r'^\s*(.*?)\s*(-?)([0-9]+)\+([0-9]+)\s*$')
+
+FRAME_RATES = ( # Positions are used as serialized frame rate ids, so only ever append.
+	Decimal('23.976'), Decimal('24'), Decimal('25'), Decimal('29.97'), Decimal('30'), Decimal('47.952'),
+	Decimal('48'), Decimal('50'), Decimal('59.94'), Decimal('60'), Decimal('119.88'), Decimal('120'),
+)
+
+_FRAME_RATE_IDS = dict((frame_rate, frame_rate_id) for frame_rate_id, frame_rate in enumerate(FRAME_RATES))
+
+_EMPTY_STATE = {
+	'timecode': None,
+	'frame_rate': None,
+	'_frame_rate_int': None,
+	'is_drop_frame': None,
+	'hours': None,
+	'minutes': None,
+	'seconds': None,
+	'frames': None,
+	'total_seconds': None,
+	'total_frames': None,
+}
+
+
 class Timecode(object):
 	"""
 	The Timecode object represents SMPTE timecodes of any possible frame rate,
@@ -39,61 +74,101 @@ class Timecode(object):
 	are assumed to be frame counts, floats/Decimals are assumed to be seconds,
 	and basestrings are attempted to be parsed into timecodes.
 	
+	Changes to a timecode are published all at once by replacing its __dict__,
+	which is never mutated afterwards, so readers on other threads never see a
+	partially updated state. Code reading several values therefore reads
+	__dict__ once and uses that snapshot throughout, and copy.copy gives a
+	consistent snapshot of a shared timecode. Concurrent writers are
+	last-writer-wins: read-modify-write updates such as t.hours += 1 from two
+	threads can lose one of the updates, and need a lock of their own.
+	
 	"""
 	
 	def __init__(self, timecode, frame_rate, is_drop_frame=None):
-		self.__dict__.update({
-			'timecode': None,
-			'frame_rate': None,
-			'_frame_rate_int': None,
-			'is_drop_frame': None,
-			'hours': None,
-			'minutes': None,
-			'seconds': None,
-			'frames': None,
-			'total_seconds': None,
-			'total_frames': None,
-		})
-		
-		self.is_drop_frame = is_drop_frame
-		self.frame_rate = frame_rate
+		object.__setattr__(self, '__dict__', self._empty_state(*self._resolve_frame_rate(frame_rate, is_drop_frame)))
 		
 		if any([isinstance(timecode, seconds_type) for seconds_type in (float, Decimal)]):
-			self.total_seconds = timecode
+			self._set('total_seconds', timecode)
 		
 		elif any([isinstance(timecode, frames_type) for frames_type in (int, long)]):
-			self.total_frames = timecode
+			self._set('total_frames', timecode)
 		
 		else:
-			self.timecode = timecode
-		
+			self._set('timecode', timecode)
+	
 	def __setattr__(self, name, value):
-		value = self._clean_input(name, value)
+		"""
+		Applies the change to a private draft of the current state, and then
+		publishes the draft in a single step, so that other threads only ever
+		observe complete states.
+		
+		"""
 		
-		if name == 'is_drop_frame' and value is None:
-			value = True if self.frame_rate in (Decimal('29.97'), Decimal('59.94')) else False
+		draft = self._draft()
+		draft._set(name, value)
+		self._publish(draft)
+	
+	def _draft(self):
+		draft = Timecode.__new__(Timecode)
+		object.__setattr__(draft, '__dict__', dict(self.__dict__))
 		
-		elif name == 'frame_rate':
-			value = Decimal('23.976') if value == Decimal('23.98') else value
-			self._frame_rate_int = int(round(value))
-			
-			if value not in (Decimal('29.97'), Decimal('59.94')):
-				new_is_drop_frame = False
-			
-			elif value in (Decimal('29.97'), Decimal('59.94')) and self.frame_rate not in (Decimal('29.97'), Decimal('59.94')):
-				new_is_drop_frame = None
-			
-			else:
-				new_is_drop_frame = self.is_drop_frame
+		return draft
+	
+	def _publish(self, other):
+		object.__setattr__(self, '__dict__', other.__dict__)
+	
+	def _resolve_frame_rate(self, frame_rate, is_drop_frame, previous=None):
+		"""
+		Cleans a frame rate and drop frame flag. If is_drop_frame is None, the
+		drop frame flag of the previous state is kept if it had a drop frame
+		rate, and otherwise drop frame rates are to be drop frame.
+		
+		Frame rates are always Decimals in a single form for each value, so
+		that 24, 24.0, and Decimal('24.00') are all Decimal('24').
+		
+		"""
+		
+		frame_rate = self._clean_input('frame_rate', frame_rate)
+		is_drop_frame = self._clean_input('is_drop_frame', is_drop_frame)
+		frame_rate = Decimal('23.976') if frame_rate == Decimal('23.98') else frame_rate
+		frame_rate = Decimal(int(frame_rate)) if frame_rate == int(frame_rate) else Decimal(frame_rate).normalize()
+		
+		if frame_rate not in (Decimal('29.97'), Decimal('59.94')):
+			return frame_rate, False
+		
+		elif is_drop_frame is not None:
+			return frame_rate, is_drop_frame
 		
-		if name in ('is_drop_frame', 'frame_rate') and None not in (self.frame_rate, self.is_drop_frame, self.total_frames, self.total_seconds):
-			self.convert_to(**{name: value, 'preserving': 'frames'})
+		elif previous is not None and previous['frame_rate'] in (Decimal('29.97'), Decimal('59.94')):
+			return frame_rate, previous['is_drop_frame']
 		
 		else:
-			super(Timecode, self).__setattr__(name, value)
+			return frame_rate, True
+	
+	@staticmethod
+	def _empty_state(frame_rate, is_drop_frame):
+		state = dict(_EMPTY_STATE)
+		state.update({'frame_rate': frame_rate, '_frame_rate_int': int(round(frame_rate)), 'is_drop_frame': is_drop_frame})
 		
+		return state
+	
+	def _set(self, name, value):
 		if name == 'frame_rate':
-			self.is_drop_frame = new_is_drop_frame
+			self._publish(self.converted(frame_rate=self._clean_input(name, value), preserving='frames'))
+		
+		elif name == 'is_drop_frame':
+			value = self._clean_input(name, value)
+			
+			if value is None:
+				value = self.frame_rate in (Decimal('29.97'), Decimal('59.94'))
+			
+			elif value and self.frame_rate not in (Decimal('29.97'), Decimal('59.94')):
+				raise RuntimeError('Bad {name}: frame_rate {frame_rate} is not in (29.97, 59.94).'.format(name=name, frame_rate=self.frame_rate))
+			
+			self._publish(self.converted(is_drop_frame=value, preserving='frames'))
+		
+		else:
+			self.__dict__[name] = self._clean_input(name, value)
 		
 		if name in ('timecode', 'total_seconds', 'total_frames', 'hours', 'minutes', 'seconds', 'frames'):
 			if name == 'timecode':
@@ -107,17 +182,37 @@ class Timecode(object):
 				self.__dict__.update(self._total_frames_to_components())
 			
 			if name in ('timecode', 'total_seconds', 'total_frames') or None not in (self.hours, self.minutes, self.seconds, self.frames):
-				self.__dict__.update(self._fix_components())
-				self.__dict__.update(self._components_to_total_seconds())
-				self.__dict__.update(self._components_to_total_frames())
-				self.__dict__.update(self._components_to_timecode())
+				self._update_from_components()
+	
+	def _update_from_components(self):
+		self.__dict__.update(self._fix_components())
+		self.__dict__.update(self._components_to_total_seconds())
+		self.__dict__.update(self._components_to_total_frames())
+		self.__dict__.update(self._components_to_timecode())
+		
+		return self
+	
+	@classmethod
+	def _from_frames(cls, total_frames, frame_rate, is_drop_frame):
+		"""
+		Creates a timecode directly from an already clean frame count, frame
+		rate, and drop frame flag, without going through __setattr__.
+		
+		"""
+		
+		timecode = cls.__new__(cls)
+		object.__setattr__(timecode, '__dict__', cls._empty_state(frame_rate, is_drop_frame))
+		timecode.__dict__['total_frames'] = total_frames
+		timecode.__dict__.update(timecode._total_frames_to_components())
+		
+		return timecode._update_from_components()
 	
 	def _clean_input(self, name, value):
 		if name == 'timecode':
 			if all([not isinstance(value, valid_type) for valid_type in (Timecode, basestring)]):
 				raise TypeError("Bad {name}: expected instance of Timecode, basestring, got {type}.".format(name=name, type=type(value)))
 			
-			elif isinstance(value, basestring) and not re.match(r'^.*?([0-9]{2,})[:;]?([0-5][0-9])[:;]?([0-5][0-9])[:;]?([0-9]{1,}).*?$', value):
+			elif isinstance(value, basestring) and not _TIMECODE_PATTERN.match(value):
 				raise ValueError("Bad {name}: expected something in the form of NN:NN:NN:NN, got {value}".format(name=name, value=value))
 		
 		elif name in ('frame_rate', 'total_seconds') and all([not isinstance(value, valid_type) for valid_type in (Timecode, float, int, long, Decimal)]):
@@ -143,7 +238,7 @@ class Timecode(object):
 		
 		"""
 		
-		hours, minutes, seconds, frames = (int(n) for n in re.match(r'^.*?([0-9]{2,})[:;]?([0-5][0-9])[:;]?([0-5][0-9])[:;]?([0-9]{1,}).*?$', self.timecode).groups())
+		hours, minutes, seconds, frames = (int(n) for n in _TIMECODE_PATTERN.match(self.timecode).groups())
 		
 		seconds += frames // self._frame_rate_int
 		minutes += seconds // 60
@@ -153,7 +248,7 @@ class Timecode(object):
 		seconds %= 60
 		minutes %= 60
 		
-		if self.is_drop_frame and (minutes % 10):
+		if self.is_drop_frame and (minutes % 10) and not seconds:
 			if self.frame_rate == Decimal('29.97') and frames < 2:
 				frames += 2
 			
@@ -240,8 +335,11 @@ class Timecode(object):
 					minutes = int((self.total_seconds % 3600) // 60)
 					
 				elif using == 'total_frames':
-					hours = int(self.total_frames // (3600 * self._frame_rate_int))
-					minutes = int(self.total_frames % (3600 * self._frame_rate_int) // (60 * self._frame_rate_int))
+					drop = 2 if self.frame_rate == Decimal('29.97') else 4
+					tens, remainder = divmod(self.total_frames, (600 * self._frame_rate_int) - (9 * drop))
+					minutes = (tens * 10) + (max(remainder - drop, 0) // ((60 * self._frame_rate_int) - drop))
+					hours = int(minutes // 60)
+					minutes = int(minutes % 60)
 				
 				else:
 					raise ValueError('bad using: expected components, total_seconds, total_frames, got {value}'.format(value=using))
@@ -273,42 +371,74 @@ class Timecode(object):
 		
 		"""
 		
+		self._publish(self.converted(frame_rate, is_drop_frame, preserving))
+	
+	def converted(self, frame_rate=None, is_drop_frame=None, preserving=None):
+		"""
+		Returns a new timecode converted as by convert_to, leaving this one
+		unchanged.
+		
+		"""
+		
 		if preserving not in ('seconds', 'frames', 'timecode'):
 			raise ValueError('bad preserving: expected seconds, frames, timecode, got {preserving}'.format(preserving=preserving))
 		
-		if is_drop_frame is None:
-			is_drop_frame = self.is_drop_frame
+		state = self.__dict__
+		frame_rate, is_drop_frame = self._resolve_frame_rate(state['frame_rate'] if frame_rate is None else frame_rate, is_drop_frame, state)
 		
-		if frame_rate is None:
-			frame_rate = self.frame_rate
+		if preserving == 'frames':
+			return Timecode._from_frames(state['total_frames'], frame_rate, is_drop_frame)
 		
-		if preserving == 'seconds':
-			self.__init__(self.total_seconds, frame_rate, is_drop_frame)
+		converted = Timecode.__new__(Timecode)
+		object.__setattr__(converted, '__dict__', self._empty_state(frame_rate, is_drop_frame))
 		
-		elif preserving == 'frames':
-			self.__init__(self.total_frames, frame_rate, is_drop_frame)
+		if preserving == 'seconds':
+			converted.__dict__['total_seconds'] = state['total_seconds']
+			
+			return Timecode._from_frames(converted._total_seconds_to_total_frames()['total_frames'], frame_rate, is_drop_frame)
 		
 		elif preserving == 'timecode':
-			self.__init__(self.timecode, frame_rate, is_drop_frame)
+			converted.__dict__['timecode'] = state['timecode']
+			converted.__dict__.update(converted._timecode_to_components())
+			
+			return converted._update_from_components()
+	
+	def __copy__(self):
+		copy = Timecode.__new__(Timecode)
+		object.__setattr__(copy, '__dict__', self.__dict__) # Published states are never mutated, so they may be shared.
+		
+		return copy
+	
+	def __deepcopy__(self, memo):
+		return self.__copy__()
+	
+	def __reduce__(self):
+		state = self.__dict__
+		
+		return (_unpickle_timecode, (state['total_frames'], _frame_rate_id(state['frame_rate']), state['is_drop_frame']))
 	
 	def __str__(self):
 		return self.timecode
 	
 	def __repr__(self):
-		return "Timecode(timecode='%s', frame_rate=%s, is_drop_frame=%s)" % (self.timecode, repr(self.frame_rate), self.is_drop_frame)
+		state = self.__dict__
+		
+		return "Timecode(timecode='%s', frame_rate=%s, is_drop_frame=%s)" % (state['timecode'], repr(state['frame_rate']), state['is_drop_frame'])
 	
 	def _op(self, op, other):
+		state = self.__dict__
+		
 		if type(other) == Timecode:
-			return Timecode(op(self.total_seconds, other.total_seconds), self.frame_rate, self.is_drop_frame)
+			return Timecode(op(state['total_seconds'], other.total_seconds), state['frame_rate'], state['is_drop_frame'])
 		
 		elif type(other) in (float, Decimal):
-			return Timecode(op(self.total_seconds, Decimal(str(other))), self.frame_rate, self.is_drop_frame)
+			return Timecode(op(state['total_seconds'], Decimal(str(other))), state['frame_rate'], state['is_drop_frame'])
 		
 		elif type(other) in (int, long):
-			return Timecode(op(self.total_frames, other), self.frame_rate, self.is_drop_frame)
+			return Timecode(op(state['total_frames'], other), state['frame_rate'], state['is_drop_frame'])
 		
 		elif isinstance(other, basestring):
-			return Timecode(op(self.total_seconds, Timecode(other, self.frame_rate, self.is_drop_frame).total_seconds), self.frame_rate, self.is_drop_frame)
+			return Timecode(op(state['total_seconds'], Timecode(other, state['frame_rate'], state['is_drop_frame']).total_seconds), state['frame_rate'], state['is_drop_frame'])
 		
 		else:
 			raise TypeError("unsupported operand type(s) for {op}: 'Timecode' and '{type}'".format(op=str(op)[19:-1], type=type(other)))
@@ -354,17 +484,19 @@ class Timecode(object):
 		return self._rop(operator.div, other)
 	
 	def __eq__(self, other):
+		state = self.__dict__
+		
 		if type(other) == Timecode:
-			return self.total_seconds == other.total_seconds
+			return state['total_seconds'] == other.total_seconds
 		
 		elif type(other) in (float, Decimal):
-			return self.total_seconds == Decimal(str(other))
+			return state['total_seconds'] == Decimal(str(other))
 		
 		elif type(other) in (int, long):
-			return self.total_frames == other
+			return state['total_frames'] == other
 		
 		elif isinstance(other, basestring):
-			return self.total_frames == Timecode(other, self.frame_rate, self.is_drop_frame).total_frames
+			return state['total_frames'] == Timecode(other, state['frame_rate'], state['is_drop_frame']).total_frames
 		
 		else:
 			return False
@@ -373,17 +505,19 @@ class Timecode(object):
 		return not self.__eq__(other)
 	
 	def __gt__(self, other):
+		state = self.__dict__
+		
 		if type(other) == Timecode:
-			return self.total_seconds > other.total_seconds
+			return state['total_seconds'] > other.total_seconds
 		
 		elif type(other) in (float, Decimal):
-			return self.total_seconds > Decimal(str(other))
+			return state['total_seconds'] > Decimal(str(other))
 		
 		elif type(other) in (int, long):
-			return self.total_frames > other
+			return state['total_frames'] > other
 		
 		elif isinstance(other, basestring):
-			return self.total_frames > Timecode(other, self.frame_rate, self.is_drop_frame).total_frames
+			return state['total_frames'] > Timecode(other, state['frame_rate'], state['is_drop_frame']).total_frames
 		
 		else:
 			return False
@@ -392,7 +526,904 @@ class Timecode(object):
 		return not self.__gt__(other)
 	
 	def __ge__(self, other):
-		return self.__gt__(other) or self.__eq__(other)
+		snapshot = self.__copy__()
+		
+		return snapshot.__gt__(other) or snapshot.__eq__(other)
 	
 	def __le__(self, other):
-		return self.__lt__(other) or self.__eq__(other)
+		snapshot = self.__copy__()
+		
+		return snapshot.__lt__(other) or snapshot.__eq__(other)
+
+
+def _frame_rate_id(frame_rate):
+	return _FRAME_RATE_IDS.get(frame_rate, str(frame_rate))
+
+
+def _frame_rate_from_id(frame_rate_id):
+	return Decimal(frame_rate_id) if isinstance(frame_rate_id, basestring) else FRAME_RATES[frame_rate_id]
+
+
+def _unpickle_timecode(total_frames, frame_rate_id, is_drop_frame):
+	return Timecode._from_frames(total_frames, _frame_rate_from_id(frame_rate_id), is_drop_frame)
+
+
+def encode_timecodes(timecodes):
+	"""
+	Encodes Timecodes sharing a frame rate as a dict of plain ints, strings,
+	and bools suitable for JSON or msgpack, storing only their total frames.
+	
+	"""
+	
+	frames = []
+	frame_rate = is_drop_frame = None
+	
+	for timecode in timecodes:
+		state = timecode.__dict__
+		
+		if frame_rate is None:
+			frame_rate, is_drop_frame = state['frame_rate'], state['is_drop_frame']
+		
+		elif state['frame_rate'] != frame_rate or state['is_drop_frame'] != is_drop_frame:
+			raise ValueError('encode_timecodes expected timecodes sharing a frame_rate and is_drop_frame, got {timecode}'.format(timecode=repr(timecode)))
+		
+		frames.append(state['total_frames'])
+	
+	return {'frame_rate': None if frame_rate is None else _frame_rate_id(frame_rate), 'is_drop_frame': is_drop_frame, 'frames': frames}
+
+
+def decode_timecodes(data):
+	"""
+	Decodes a dict from encode_timecodes into a list of Timecodes.
+	
+	"""
+	
+	if not len(data['frames']):
+		return []
+	
+	frame_rate, is_drop_frame = _frame_rate_from_id(data['frame_rate']), data['is_drop_frame']
+	
+	return [Timecode._from_frames(int(frames), frame_rate, is_drop_frame) for frames in data['frames']]
+
+
+def _to_frames(value, frame_rate, is_drop_frame):
+	"""
+	Returns a value as a frame count at frame_rate, handling values as in
+	Timecode arithmetic, and converting Timecodes of another frame rate
+	preserving seconds.
+	
+	"""
+	
+	if type(value) == Timecode:
+		state = value.__dict__
+		
+		if state['frame_rate'] == frame_rate:
+			return state['total_frames']
+		
+		value = state['total_seconds']
+	
+	elif type(value) in (int, long):
+		return value
+	
+	elif type(value) not in (float, Decimal) and not isinstance(value, basestring):
+		raise TypeError("unsupported type for frames: '{type}'".format(type=type(value)))
+	
+	return Timecode(value, frame_rate, is_drop_frame).total_frames
+
+
+def _to_frames_inferring(value, frame_rate, is_drop_frame):
+	"""
+	Returns a value as a frame count as _to_frames does, along with the frame
+	rate and drop frame flag used. If frame_rate is None, they are taken from
+	value, which must then be a Timecode, keeping is_drop_frame if given.
+	
+	"""
+	
+	if frame_rate is None:
+		if type(value) != Timecode:
+			raise ValueError('no frame_rate: pass one, or start with a Timecode')
+		
+		state = value.__dict__
+		zero = Timecode(0, state['frame_rate'], state['is_drop_frame'] if is_drop_frame is None else is_drop_frame)
+		frame_rate, is_drop_frame = zero.frame_rate, zero.is_drop_frame
+	
+	return _to_frames(value, frame_rate, is_drop_frame), frame_rate, is_drop_frame
+
+
+class Accumulator(object):
+	"""
+	The Accumulator object gathers the total, minimum, and maximum of a run of
+	timecodes as plain frame counts, only creating Timecode objects when a
+	result is asked for.
+	
+	Values are handled as in Timecode arithmetic: ints/longs are frame counts,
+	floats/Decimals are seconds, and basestrings are parsed into timecodes.
+	Timecodes of another frame rate are converted preserving seconds.
+	
+	If frame_rate is None, the frame rate of the first Timecode added is used,
+	along with its drop frame flag unless is_drop_frame is given.
+	
+	"""
+	
+	def __init__(self, frame_rate=None, is_drop_frame=None):
+		self.frame_rate = None
+		self.is_drop_frame = is_drop_frame
+		self.count = 0
+		self.total_frames = 0
+		self.min_frames = None
+		self.max_frames = None
+		
+		if frame_rate is not None:
+			zero = Timecode(0, frame_rate, is_drop_frame)
+			self.frame_rate, self.is_drop_frame = zero.frame_rate, zero.is_drop_frame
+	
+	def add(self, value):
+		frames, self.frame_rate, self.is_drop_frame = _to_frames_inferring(value, self.frame_rate, self.is_drop_frame)
+		
+		self.count += 1
+		self.total_frames += frames
+		
+		if self.min_frames is None or frames < self.min_frames:
+			self.min_frames = frames
+		
+		if self.max_frames is None or frames > self.max_frames:
+			self.max_frames = frames
+		
+		return self
+	
+	def extend(self, values):
+		for value in values:
+			self.add(value)
+		
+		return self
+	
+	def _timecode(self, frames, name):
+		if self.frame_rate is None:
+			raise ValueError('{name} of an empty Accumulator requires a frame_rate'.format(name=name))
+		
+		if frames is None:
+			raise ValueError('{name} of an empty Accumulator'.format(name=name))
+		
+		return Timecode(frames, self.frame_rate, self.is_drop_frame)
+	
+	@property
+	def total(self):
+		return self._timecode(self.total_frames, 'total')
+	
+	@property
+	def minimum(self):
+		return self._timecode(self.min_frames, 'minimum')
+	
+	@property
+	def maximum(self):
+		return self._timecode(self.max_frames, 'maximum')
+	
+	@property
+	def span(self):
+		return self._timecode(None if self.count == 0 else self.max_frames - self.min_frames, 'span')
+
+
+def total(values, frame_rate=None, is_drop_frame=None):
+	"""
+	Returns the sum of values as a single Timecode.
+	
+	"""
+	
+	return Accumulator(frame_rate, is_drop_frame).extend(values).total
+
+
+def minimum(values, frame_rate=None, is_drop_frame=None):
+	"""
+	Returns the earliest of values as a single Timecode.
+	
+	"""
+	
+	return Accumulator(frame_rate, is_drop_frame).extend(values).minimum
+
+
+def maximum(values, frame_rate=None, is_drop_frame=None):
+	"""
+	Returns the latest of values as a single Timecode.
+	
+	"""
+	
+	return Accumulator(frame_rate, is_drop_frame).extend(values).maximum
+
+
+def span(values, frame_rate=None, is_drop_frame=None):
+	"""
+	Returns the duration between the earliest and latest of values as a single
+	Timecode.
+	
+	"""
+	
+	return Accumulator(frame_rate, is_drop_frame).extend(values).span
+
+
+def _require_numpy(name):
+	if numpy is None: # pragma: no cover (optional dependency).
+		raise ImportError('{name} requires numpy'.format(name=name))
+
+
+def frame_duration(frame_rate):
+	"""
+	Returns the exact duration of a single frame in seconds as a Fraction.
+	
+	NTSC frame rates (23.976, 29.97, 59.94, and so on) run at 1000/1001 of
+	their nominal rate, so 29.97 gives 1001/30000. Note that this is real time,
+	whereas total_seconds counts timecode time at the nominal rate.
+	
+	"""
+	
+	frame_rate = Timecode(0, frame_rate).frame_rate
+	frame_rate_int = int(round(frame_rate))
+	
+	if frame_rate != frame_rate_int and abs(frame_rate - Decimal(frame_rate_int * 1000) / 1001) < Decimal('0.01'):
+		return Fraction(1001, frame_rate_int * 1000)
+	
+	return 1 / Fraction(frame_rate)
+
+
+def _nanoseconds_per_frame(frame_rate):
+	duration = frame_duration(frame_rate) * 1000000000
+	
+	return duration.numerator, duration.denominator
+
+
+PULL_UP = Fraction(1001, 1000)
+PULL_DOWN = Fraction(1000, 1001)
+
+
+def samples_per_frame(frame_rate, sample_rate):
+	"""
+	Returns the exact number of audio samples per frame as a Fraction.
+	
+	Pulled up or down sample rates may be given as, for example,
+	48000 * PULL_DOWN. At 29.97 and 48000 this is 8008/5, so frames alternate
+	between 1602 and 1601 samples.
+	
+	"""
+	
+	if isinstance(sample_rate, float):
+		sample_rate = Decimal(str(sample_rate))
+	
+	return Fraction(sample_rate) * frame_duration(frame_rate)
+
+
+def timecode_to_sample(timecode, sample_rate):
+	"""
+	Returns the index of the first audio sample of a Timecode's frame.
+	
+	Frames start on the sample nearest to their exact start time, which gives
+	the standard 1602, 1601, 1602, 1601, 1602 cadence at 29.97 and 48000.
+	
+	"""
+	
+	state = timecode.__dict__
+	duration = samples_per_frame(state['frame_rate'], sample_rate)
+	
+	return ((2 * state['total_frames'] * duration.numerator) + duration.denominator) // (2 * duration.denominator)
+
+
+def sample_to_timecode(sample, frame_rate, sample_rate, is_drop_frame=None):
+	"""
+	Returns the Timecode of the frame containing an audio sample index.
+	
+	"""
+	
+	duration = samples_per_frame(frame_rate, sample_rate)
+	
+	return Timecode(int(((duration.denominator * ((2 * sample) + 1)) - 1) // (2 * duration.numerator)), frame_rate, is_drop_frame)
+
+
+def frames_to_samples(frames, frame_rate, sample_rate):
+	"""
+	Converts an array of frame counts to an int64 array of the indices of
+	their first audio samples.
+	
+	"""
+	
+	_require_numpy('frames_to_samples')
+	
+	duration = samples_per_frame(frame_rate, sample_rate)
+	frames = numpy.asarray(frames, dtype=numpy.int64)
+	
+	return ((2 * frames * duration.numerator) + duration.denominator) // (2 * duration.denominator)
+
+
+def samples_to_frames(samples, frame_rate, sample_rate):
+	"""
+	Converts an array of audio sample indices to an int64 array of the frame
+	counts containing them.
+	
+	"""
+	
+	_require_numpy('samples_to_frames')
+	
+	duration = samples_per_frame(frame_rate, sample_rate)
+	samples = numpy.asarray(samples, dtype=numpy.int64)
+	
+	return ((duration.denominator * ((2 * samples) + 1)) - 1) // (2 * duration.numerator)
+
+
+FILM_FORMATS = { # Perforations per frame, perforations per foot, perforations per key number.
+	'35mm 4-perf': (4, 64, 64),
+	'35mm 3-perf': (3, 64, 64),
+	'16mm': (1, 40, 20),
+}
+
+
+def _film_format(film_format):
+	try:
+		return FILM_FORMATS[film_format]
+	
+	except KeyError:
+		raise ValueError('bad film_format: expected one of {formats}, got {value}'.format(formats=', '.join(sorted(FILM_FORMATS)), value=film_format))
+
+
+def _frames(value):
+	if type(value) == Timecode:
+		return value.total_frames
+	
+	elif type(value) in (int, long):
+		return value
+	
+	else:
+		raise TypeError("Bad frames: expected instance of Timecode, int, long, got {type}.".format(type=type(value)))
+
+
+def _count_to_frames(value, perfs_per_frame, perfs_per_unit, name):
+	"""
+	Parses a count of units and frames into the unit, such as feet+frames,
+	returning any prefix, the width of the units, and the frame count.
+	
+	Units are counted by floor division, so frames into a unit are always
+	counted forwards, and -2+15 is the frame before 0+00 in 35mm 4-perf.
+	
+	"""
+	
+	match = _FOOTAGE_PATTERN.match(value) if isinstance(value, basestring) else None
+	
+	if match is None:
+		raise ValueError("Bad {name}: expected something in the form of N+NN, got {value}".format(name=name, value=value))
+	
+	prefix, sign, units, frames = match.groups()
+	units, frames = (-1 if sign else 1) * int(units), int(frames)
+	unit_start = -(-units * perfs_per_unit // perfs_per_frame)
+	
+	unit_frames = -(-(units + 1) * perfs_per_unit // perfs_per_frame) - unit_start
+	
+	if frames >= unit_frames:
+		raise ValueError("Bad {name}: expected fewer than {unit_frames} frames after {units}+, got {value}".format(name=name, unit_frames=unit_frames, units=units, value=value))
+	
+	return prefix, len(match.group(3)), unit_start + frames
+
+
+def _frames_to_count(frames, perfs_per_frame, perfs_per_unit):
+	perfs = frames * perfs_per_frame
+	
+	return perfs // perfs_per_unit, (perfs % perfs_per_unit) // perfs_per_frame
+
+
+def frames_to_footage(frames, film_format='35mm 4-perf'):
+	"""
+	Returns a frame count or Timecode as film footage in the form of feet+frames.
+	
+	Frames are counted one to one, so a 23.976 Timecode gives the footage of
+	the film frames it was transferred from. With 3-perf, feet alternate
+	between 22, 21, and 21 frames. Negative frame counts give negative feet
+	with frames counted forwards, so -17 is -2+15, as with frames_to_feet.
+	
+	"""
+	
+	perfs_per_frame, perfs_per_foot, perfs_per_key = _film_format(film_format)
+	
+	return '%d+%02d' % _frames_to_count(_frames(frames), perfs_per_frame, perfs_per_foot)
+
+
+def footage_to_frames(footage, film_format='35mm 4-perf'):
+	"""
+	Returns the frame count of film footage in the form of feet+frames.
+	
+	"""
+	
+	perfs_per_frame, perfs_per_foot, perfs_per_key = _film_format(film_format)
+	prefix, width, frames = _count_to_frames(footage, perfs_per_frame, perfs_per_foot, 'footage')
+	
+	if prefix:
+		raise ValueError("Bad footage: expected something in the form of N+NN, got {value}".format(value=footage))
+	
+	return frames
+
+
+def _keycode_to_frames(keycode, film_format):
+	perfs_per_frame, perfs_per_foot, perfs_per_key = _film_format(film_format)
+	prefix, width, frames = _count_to_frames(keycode, perfs_per_frame, perfs_per_key, 'keycode')
+	
+	if frames < 0:
+		raise ValueError("Bad keycode: expected a key number of at least 0, got {value}".format(value=keycode))
+	
+	return prefix, width, frames
+
+
+def frames_to_keycode(frames, start, film_format='35mm 4-perf'):
+	"""
+	Returns the keycode of a frame count or Timecode, counting from the keycode
+	of its first frame, such as 'KU 22 9612 1234+05'.
+	
+	Key numbers are every 64 perforations on 35mm, and every 20 frames on 16mm.
+	
+	"""
+	
+	perfs_per_frame, perfs_per_foot, perfs_per_key = _film_format(film_format)
+	prefix, width, start = _keycode_to_frames(start, film_format)
+	frames = start + _frames(frames)
+	
+	if frames < 0:
+		raise ValueError("Bad frames: {frames} frames is before the first key number".format(frames=frames - start))
+	
+	key, key_frames = _frames_to_count(frames, perfs_per_frame, perfs_per_key)
+	
+	return '%s%s+%02d' % (prefix + ' ' if prefix else '', str(key).zfill(width), key_frames)
+
+
+def keycode_to_frames(keycode, start, film_format='35mm 4-perf'):
+	"""
+	Returns the frame count of a keycode, counting from the keycode of the
+	first frame.
+	
+	"""
+	
+	prefix, width, frames = _keycode_to_frames(keycode, film_format)
+	start_prefix, start_width, start = _keycode_to_frames(start, film_format)
+	
+	if prefix != start_prefix:
+		raise ValueError("Bad keycode: expected prefix {expected}, got {value}".format(expected=start_prefix, value=prefix))
+	
+	return frames - start
+
+
+def _frames_to_counts(frames, perfs_per_frame, perfs_per_unit):
+	units, perfs = numpy.divmod(numpy.asarray(frames, dtype=numpy.int64) * perfs_per_frame, perfs_per_unit)
+	
+	return units, perfs // perfs_per_frame
+
+
+def _counts_to_frames(units, frames, perfs_per_frame, perfs_per_unit, name):
+	units, frames = numpy.broadcast_arrays(numpy.asarray(units, dtype=numpy.int64), numpy.asarray(frames, dtype=numpy.int64))
+	unit_start = -(-units * perfs_per_unit // perfs_per_frame)
+	unit_frames = -(-(units + 1) * perfs_per_unit // perfs_per_frame) - unit_start
+	bad = numpy.flatnonzero((frames < 0) | (frames >= unit_frames))
+	
+	if len(bad):
+		units, frames, unit_frames = units.flat[bad[0]], frames.flat[bad[0]], unit_frames.flat[bad[0]]
+		raise ValueError("Bad {name}: expected fewer than {unit_frames} frames after {units}+, got {frames}".format(name=name, unit_frames=unit_frames, units=units, frames=frames))
+	
+	return unit_start + frames
+
+
+def frames_to_feet(frames, film_format='35mm 4-perf'):
+	"""
+	Converts an array of frame counts to int64 arrays of feet and frames into
+	each foot.
+	
+	"""
+	
+	_require_numpy('frames_to_feet')
+	
+	perfs_per_frame, perfs_per_foot, perfs_per_key = _film_format(film_format)
+	
+	return _frames_to_counts(frames, perfs_per_frame, perfs_per_foot)
+
+
+def feet_to_frames(feet, frames, film_format='35mm 4-perf'):
+	"""
+	Converts arrays of feet and frames into each foot to an int64 array of frame
+	counts. Frames past the end of their foot raise ValueError, as with
+	footage_to_frames.
+	
+	"""
+	
+	_require_numpy('feet_to_frames')
+	
+	perfs_per_frame, perfs_per_foot, perfs_per_key = _film_format(film_format)
+	
+	return _counts_to_frames(feet, frames, perfs_per_frame, perfs_per_foot, 'footage')
+
+
+def frames_to_keys(frames, start, film_format='35mm 4-perf'):
+	"""
+	Converts an array of frame counts to int64 arrays of key numbers and frames
+	into each key, counting from the keycode of the first frame. The keycode's
+	prefix is left to the caller.
+	
+	"""
+	
+	_require_numpy('frames_to_keys')
+	
+	perfs_per_frame, perfs_per_foot, perfs_per_key = _film_format(film_format)
+	prefix, width, start = _keycode_to_frames(start, film_format)
+	frames = start + numpy.asarray(frames, dtype=numpy.int64)
+	
+	if (frames < 0).any():
+		raise ValueError("Bad frames: {frames} frames is before the first key number".format(frames=frames.min() - start))
+	
+	return _frames_to_counts(frames, perfs_per_frame, perfs_per_key)
+
+
+def keys_to_frames(keys, frames, start, film_format='35mm 4-perf'):
+	"""
+	Converts arrays of key numbers and frames into each key to an int64 array
+	of frame counts, counting from the keycode of the first frame.
+	
+	"""
+	
+	_require_numpy('keys_to_frames')
+	
+	perfs_per_frame, perfs_per_foot, perfs_per_key = _film_format(film_format)
+	prefix, width, start = _keycode_to_frames(start, film_format)
+	
+	if (numpy.asarray(keys) < 0).any():
+		raise ValueError("Bad keys: expected key numbers of at least 0, got {keys}".format(keys=numpy.asarray(keys).min()))
+	
+	return _counts_to_frames(keys, frames, perfs_per_frame, perfs_per_key, 'keycode') - start
+
+
+NAT_FRAMES = -2 ** 63 # The frame count standing in for NaT, matching NaT's own int64 value.
+
+
+def frames_array(timecodes):
+	"""
+	Returns the total frames of an iterable of Timecodes as an int64 array.
+	
+	"""
+	
+	_require_numpy('frames_array')
+	
+	return numpy.fromiter((timecode.__dict__['total_frames'] for timecode in timecodes), dtype=numpy.int64)
+
+
+def timecodes_from_frames(frames, frame_rate, is_drop_frame=None):
+	"""
+	Returns a list of Timecodes for an array of frame counts. Frame counts of
+	NAT_FRAMES have no Timecode, and raise ValueError; mask them out first.
+	
+	"""
+	
+	zero = Timecode(0, frame_rate, is_drop_frame)
+	timecodes = []
+	
+	for n in frames:
+		if n == NAT_FRAMES:
+			raise ValueError('timecodes_from_frames got NAT_FRAMES, which has no Timecode')
+		
+		timecodes.append(Timecode._from_frames(int(n), zero.frame_rate, zero.is_drop_frame))
+	
+	return timecodes
+
+
+def frames_to_timedelta64(frames, frame_rate):
+	"""
+	Converts an array of frame counts to a timedelta64[ns] array, rounding to
+	the nearest nanosecond. Frame counts of NAT_FRAMES become NaT, and frame
+	counts too long for timedelta64[ns] raise OverflowError.
+	
+	"""
+	
+	_require_numpy('frames_to_timedelta64')
+	
+	numerator, denominator = _nanoseconds_per_frame(frame_rate)
+	frames = numpy.asarray(frames, dtype=numpy.int64)
+	
+	# The frame counts whose rounded nanoseconds fit in (-2 ** 63, 2 ** 63).
+	limit = denominator * (2 ** 64 - 1)
+	valid = frames[frames != NAT_FRAMES]
+	
+	if len(valid) and (valid.min() < -(limit // (2 * numerator)) or valid.max() > (limit - 1) // (2 * numerator)):
+		raise OverflowError('Bad frames: expected at most {0} frames either way at {1} fps'.format((limit - 1) // (2 * numerator), frame_rate))
+	
+	quotient, remainder = numpy.divmod(frames, denominator)
+	nanoseconds = (quotient * numerator) + (((2 * remainder * numerator) + denominator) // (2 * denominator))
+	
+	return numpy.where(frames == NAT_FRAMES, numpy.timedelta64('NaT', 'ns'), nanoseconds.astype('timedelta64[ns]'))
+
+
+def timedelta64_to_frames(deltas, frame_rate):
+	"""
+	Converts a timedelta64 array to an int64 array of frame counts, rounding to
+	the nearest frame. NaT becomes NAT_FRAMES rather than raising, so that
+	missing values can be masked with frames == NAT_FRAMES.
+	
+	"""
+	
+	_require_numpy('timedelta64_to_frames')
+	
+	numerator, denominator = _nanoseconds_per_frame(frame_rate)
+	deltas = numpy.asarray(deltas).astype('timedelta64[ns]')
+	quotient, remainder = numpy.divmod(deltas.astype(numpy.int64), numerator)
+	frames = (quotient * denominator) + (((2 * remainder * denominator) + numerator) // (2 * numerator))
+	
+	return numpy.where(numpy.isnat(deltas), NAT_FRAMES, frames)
+
+
+def frames_to_datetime64(frames, frame_rate, start):
+	"""
+	Converts an array of frame counts to a datetime64[ns] array, counting from
+	start. Frame counts of NAT_FRAMES become NaT.
+	
+	"""
+	
+	_require_numpy('frames_to_datetime64')
+	
+	return numpy.datetime64(start, 'ns') + frames_to_timedelta64(frames, frame_rate)
+
+
+def datetime64_to_frames(datetimes, frame_rate, start):
+	"""
+	Converts a datetime64 array to an int64 array of frame counts since start,
+	rounding to the nearest frame. NaT becomes NAT_FRAMES.
+	
+	"""
+	
+	_require_numpy('datetime64_to_frames')
+	
+	return timedelta64_to_frames(numpy.asarray(datetimes).astype('datetime64[ns]') - numpy.datetime64(start, 'ns'), frame_rate)
+
+
+VALID = 0
+BAD_FORMAT = 1
+BAD_FRAMES = 2
+DROPPED_FRAME = 3
+
+REASONS = {
+	VALID: 'valid',
+	BAD_FORMAT: 'expected something in the form of NN:NN:NN:NN',
+	BAD_FRAMES: 'frames must be less than the frame rate',
+	DROPPED_FRAME: 'frame number is dropped in drop frame timecode',
+}
+
+
+def validate_timecodes(values, frame_rate, is_drop_frame=None):
+	"""
+	Validates an iterable of timecode strings without raising, returning a
+	tuple of arrays: total frames, a mask of invalid entries, and a reason
+	code for each entry (one of VALID, BAD_FORMAT, BAD_FRAMES, DROPPED_FRAME).
+	
+	Unlike Timecode, only strings of the form HH:MM:SS:FF are accepted, with
+	: or ; between the fields, any of :;., before the frames, and surrounding
+	whitespace. Invalid entries have a total frames of 0.
+	
+	"""
+	
+	_require_numpy('validate_timecodes')
+	
+	zero = Timecode(0, frame_rate, is_drop_frame)
+	match = _STRICT_TIMECODE_PATTERN.match
+	components = []
+	reasons = []
+	
+	for value in values:
+		groups = match(value) if isinstance(value, basestring) else None
+		
+		if groups is None:
+			components.append((0, 0, 0, 0))
+			reasons.append(BAD_FORMAT)
+		
+		else:
+			hours, minutes, seconds, frames = groups.groups()
+			components.append((int(hours), int(minutes), int(seconds), int(frames)))
+			reasons.append(VALID)
+	
+	components = numpy.array(components, dtype=numpy.int64).reshape(-1, 4)
+	reasons = numpy.array(reasons, dtype=numpy.int8)
+	hours, minutes, seconds, frames = components.T
+	
+	total_minutes = (hours * 60) + minutes
+	total_frames = (((total_minutes * 60) + seconds) * zero._frame_rate_int) + frames
+	reasons[(reasons == VALID) & (frames >= zero._frame_rate_int)] = BAD_FRAMES
+	
+	if zero.is_drop_frame:
+		drop = 4 if zero.frame_rate == Decimal('59.94') else 2
+		total_frames -= drop * (total_minutes - (total_minutes // 10)) # "Drop" frames every minute except every tenth.
+		reasons[(reasons == VALID) & (seconds == 0) & (minutes % 10 != 0) & (frames < drop)] = DROPPED_FRAME
+	
+	invalid = reasons != VALID
+	total_frames[invalid] = 0
+	
+	return total_frames, invalid, reasons
+
+
+class TimecodeMap(object):
+	"""
+	The TimecodeMap object maps between the frames of a file and timecodes
+	that are continuous only in segments, such as record run timecode with
+	breaks.
+	
+	Segments are given as (file frame, timecode) pairs in order of file frame,
+	each running until the next begins, with the last running until length.
+	Lookups use binary search. Where timecode repeats, lookups by timecode find
+	its first occurrence in the file.
+	
+	TimecodeMaps are not changed after they are created, and may be shared
+	between threads.
+	
+	"""
+	
+	def __init__(self, segments, length, frame_rate, is_drop_frame=None):
+		zero = Timecode(0, frame_rate, is_drop_frame)
+		self.frame_rate, self.is_drop_frame = zero.frame_rate, zero.is_drop_frame
+		self.length = length
+		self.segments = [(file_frame, _to_frames(timecode, self.frame_rate, self.is_drop_frame)) for file_frame, timecode in segments]
+		
+		if length > 0 and not self.segments:
+			raise ValueError('Bad segments: expected at least one segment for length {length}, got none'.format(length=length))
+		
+		if self.segments and self.segments[0][0] < 0:
+			raise ValueError('Bad segments: expected a first file frame of at least 0, got {file_frame}'.format(file_frame=self.segments[0][0]))
+		
+		for (file_frame, timecode_frame), end in zip(self.segments, [file_frame for file_frame, timecode_frame in self.segments[1:]] + [length]):
+			if end <= file_frame:
+				raise ValueError('Bad segments: expected file frames in increasing order and less than length, got {file_frame} before {end}'.format(file_frame=file_frame, end=end))
+		
+		self._file_starts = [file_frame for file_frame, timecode_frame in self.segments]
+		self._timecode_starts = [timecode_frame for file_frame, timecode_frame in self.segments]
+		self._lengths = [end - file_frame for file_frame, end in zip(self._file_starts, self._file_starts[1:] + [length])]
+		
+		self._piece_starts, self._piece_ends, self._piece_offsets = self._timecode_pieces()
+		
+		if numpy is not None:
+			self._arrays = tuple(numpy.array(values, dtype=numpy.int64) for values in (
+				self._file_starts, self._timecode_starts,
+				self._piece_starts, self._piece_ends, self._piece_offsets,
+			))
+	
+	def _timecode_pieces(self):
+		"""
+		Splits timecode into sorted, non overlapping pieces, each mapping to
+		the file by a single offset, taken from the segment covering it that
+		comes first in the file.
+		
+		"""
+		
+		by_timecode = sorted(zip(self._timecode_starts, self._file_starts, self._lengths))
+		points = sorted(set(self._timecode_starts) | set(start + length for start, length in zip(self._timecode_starts, self._lengths)))
+		starts, ends, offsets = [], [], []
+		active = [] # Heap of (file frame, timecode end, timecode start), with ended segments removed lazily.
+		next_segment = 0
+		
+		for point, next_point in zip(points, points[1:]):
+			while next_segment < len(by_timecode) and by_timecode[next_segment][0] <= point:
+				timecode_start, file_start, length = by_timecode[next_segment]
+				heappush(active, (file_start, timecode_start + length, timecode_start))
+				next_segment += 1
+			
+			while active and active[0][1] <= point:
+				heappop(active)
+			
+			if active:
+				offset = active[0][0] - active[0][2]
+				
+				if ends and ends[-1] == point and offsets[-1] == offset:
+					ends[-1] = next_point
+				
+				else:
+					starts.append(point)
+					ends.append(next_point)
+					offsets.append(offset)
+		
+		return starts, ends, offsets
+	
+	@classmethod
+	def from_timecodes(cls, timecodes, frame_rate=None, is_drop_frame=None):
+		"""
+		Builds a TimecodeMap in a single pass over the timecode of every frame
+		in a file, starting a new segment wherever timecode is not continuous.
+		
+		An array of frame counts, such as from validate_timecodes, is handled
+		without a Python loop.
+		
+		"""
+		
+		if numpy is not None and isinstance(timecodes, numpy.ndarray):
+			if frame_rate is None:
+				raise ValueError('TimecodeMap.from_timecodes of an array requires a frame_rate')
+			
+			timecodes = timecodes.astype(numpy.int64)
+			starts = numpy.flatnonzero(numpy.diff(timecodes) != 1) + 1
+			starts = numpy.concatenate(([0], starts)) if len(timecodes) else starts
+			
+			return cls(zip(starts.tolist(), timecodes[starts].tolist()), len(timecodes), frame_rate, is_drop_frame)
+		
+		segments = []
+		previous = None
+		length = 0
+		
+		for timecode in timecodes:
+			frames, frame_rate, is_drop_frame = _to_frames_inferring(timecode, frame_rate, is_drop_frame)
+			
+			if previous is None or frames != previous + 1:
+				segments.append((length, frames))
+			
+			previous = frames
+			length += 1
+		
+		if frame_rate is None:
+			raise ValueError('TimecodeMap.from_timecodes of an empty iterable requires a frame_rate')
+		
+		return cls(segments, length, frame_rate, is_drop_frame)
+	
+	def __len__(self):
+		return self.length
+	
+	def __repr__(self):
+		return "TimecodeMap(segments=%d, length=%d, frame_rate=%s, is_drop_frame=%s)" % (len(self.segments), self.length, repr(self.frame_rate), self.is_drop_frame)
+	
+	def timecode_at(self, file_frame):
+		"""
+		Returns the Timecode of a file frame.
+		
+		"""
+		
+		index = bisect_right(self._file_starts, file_frame) - 1
+		
+		if index < 0 or not 0 <= file_frame < self.length:
+			raise IndexError('file frame {file_frame} is not in the map'.format(file_frame=file_frame))
+		
+		return Timecode(self._timecode_starts[index] + file_frame - self._file_starts[index], self.frame_rate, self.is_drop_frame)
+	
+	def file_frame_at(self, timecode):
+		"""
+		Returns the file frame of a timecode, handling values as in Timecode
+		arithmetic.
+		
+		"""
+		
+		frames = _to_frames(timecode, self.frame_rate, self.is_drop_frame)
+		index = bisect_right(self._piece_starts, frames) - 1
+		
+		if index < 0 or frames >= self._piece_ends[index]:
+			raise ValueError('timecode {timecode} is not in the map'.format(timecode=timecode))
+		
+		return frames + self._piece_offsets[index]
+	
+	def timecode_frames(self, file_frames):
+		"""
+		Converts an array of file frames to an int64 array of timecode frame
+		counts, with -1 for file frames not in the map.
+		
+		"""
+		
+		_require_numpy('TimecodeMap.timecode_frames')
+		
+		file_starts, timecode_starts = self._arrays[:2]
+		file_frames = numpy.asarray(file_frames, dtype=numpy.int64)
+		
+		if not len(file_starts):
+			return numpy.full(file_frames.shape, -1, dtype=numpy.int64)
+		
+		indices = numpy.searchsorted(file_starts, file_frames, side='right') - 1
+		valid_indices = numpy.maximum(indices, 0)
+		valid = (indices >= 0) & (file_frames >= 0) & (file_frames < self.length)
+		
+		return numpy.where(valid, timecode_starts[valid_indices] + file_frames - file_starts[valid_indices], -1)
+	
+	def file_frames(self, timecode_frames):
+		"""
+		Converts an array of timecode frame counts to an int64 array of file
+		frames, with -1 for timecodes not in the map.
+		
+		"""
+		
+		_require_numpy('TimecodeMap.file_frames')
+		
+		piece_starts, piece_ends, piece_offsets = self._arrays[2:]
+		timecode_frames = numpy.asarray(timecode_frames, dtype=numpy.int64)
+		
+		if not len(piece_starts):
+			return numpy.full(timecode_frames.shape, -1, dtype=numpy.int64)
+		
+		indices = numpy.searchsorted(piece_starts, timecode_frames, side='right') - 1
+		valid_indices = numpy.maximum(indices, 0)
+		valid = (indices >= 0) & (timecode_frames < piece_ends[valid_indices])
+		
+		return numpy.where(valid, timecode_frames + piece_offsets[valid_indices], -1)